@@ -1,14 +1,13 @@
 import os
 import cv2
-import json
 import logging
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, redirect, url_for, Response, session, send_file
 from werkzeug.middleware.proxy_fix import ProxyFix
 from detection import MalpracticeDetector
+from capture import FrameGrabber, NETWORK_SCHEMES
+from streaming import FramePublisher
 from utils import generate_pdf_report
-import threading
-import time
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -26,7 +25,8 @@ current_counts = {
     'talking': 0
 }
 video_source = None
-monitoring_thread = None
+frame_grabber = None
+frame_publisher = None
 
 @app.route('/')
 def index():
@@ -36,7 +36,12 @@ def index():
 @app.route('/start_monitoring', methods=['POST'])
 def start_monitoring():
     """Initialize monitoring session"""
-    global detector, monitoring_active, malpractice_log, current_counts, video_source
+    global detector, monitoring_active, malpractice_log, current_counts, video_source, frame_grabber, frame_publisher
+    
+    # Stop the previous session's capture first so its publisher can't log
+    # into the new session's data
+    monitoring_active = False
+    stop_capture()
     
     # Reset session data
     malpractice_log = []
@@ -51,9 +56,12 @@ def start_monitoring():
     local_video_path = request.form.get('local_video_path', '')
     
     if use_local_video and local_video_path:
-        if not os.path.exists(local_video_path):
+        if local_video_path.lower().startswith(NETWORK_SCHEMES):
+            video_source = local_video_path  # IP/RTSP camera stream
+        elif not os.path.exists(local_video_path):
             return jsonify({'error': 'Video file not found'}), 400
-        video_source = local_video_path
+        else:
+            video_source = local_video_path
     else:
         video_source = 0  # Default camera
     
@@ -61,6 +69,11 @@ def start_monitoring():
     detector = MalpracticeDetector()
     monitoring_active = True
     
+    # Start background capture (newest frame only) and a single shared
+    # publisher that runs detection once for every viewer
+    frame_grabber = FrameGrabber(video_source).start()
+    frame_publisher = FramePublisher(frame_grabber, detector, on_detections=record_detections).start()
+    
     # Store session start time
     session['session_start'] = datetime.now().isoformat()
     
@@ -78,94 +91,113 @@ def stop_monitoring():
     """Stop monitoring session"""
     global monitoring_active
     monitoring_active = False
+    stop_capture()
     
     # Store session end time
     session['session_end'] = datetime.now().isoformat()
     
     return redirect(url_for('summary'))
 
+def stop_capture():
+    """Stop the frame publisher and capture thread of the current session"""
+    global frame_grabber, frame_publisher
+    
+    if frame_publisher:
+        frame_publisher.stop()
+        frame_publisher = None
+    if frame_grabber:
+        frame_grabber.stop()
+        frame_grabber = None
+
+def record_detections(frame, detections, overlay):
+    """Log detections and save annotated snapshots (called from the publisher thread)"""
+    global detector, malpractice_log, current_counts
+    
+    timestamp = datetime.now()
+    annotated_frame = detector.draw_overlays(frame, overlay)
+    for detection in detections:
+        detection_type = detection['type']
+        confidence = detection['confidence']
+        
+        # Update counts
+        current_counts[detection_type] += 1
+        
+        # Create log entry
+        log_entry = {
+            'timestamp': timestamp.isoformat(),
+            'type': detection_type,
+            'confidence': confidence,
+            'count': current_counts[detection_type]
+        }
+        
+        malpractice_log.append(log_entry)
+        
+        # Save snapshot
+        snapshot_filename = f"snapshot_{detection_type}_{timestamp.strftime('%Y%m%d_%H%M%S')}.jpg"
+        snapshot_path = os.path.join('snapshots', snapshot_filename)
+        cv2.imwrite(snapshot_path, annotated_frame)
+        
+        log_entry['snapshot'] = snapshot_filename
+
 @app.route('/video_feed')
 def video_feed():
     """Video streaming route"""
     return Response(generate_frames(), mimetype='multipart/x-mixed-replace; boundary=frame')
 
 def generate_frames():
-    """Generate video frames with detection overlays"""
-    global detector, monitoring_active, malpractice_log, current_counts, video_source
-    
-    if not detector or not monitoring_active:
+    """Yield the shared publisher's encoded frames, skipping any this viewer was too slow for"""
+    publisher = frame_publisher
+    if not monitoring_active or not publisher:
         return
     
-    cap = cv2.VideoCapture(video_source)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-    
-    try:
-        while monitoring_active:
-            success, frame = cap.read()
-            if not success:
-                if isinstance(video_source, str):  # Local video file
-                    # Loop the video
-                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    continue
-                else:
-                    break
-            
-            # Process frame for malpractice detection
-            processed_frame, detections = detector.process_frame(frame)
-            
-            # Log detections
-            if detections:
-                timestamp = datetime.now()
-                for detection in detections:
-                    detection_type = detection['type']
-                    confidence = detection['confidence']
-                    
-                    # Update counts
-                    current_counts[detection_type] += 1
-                    
-                    # Create log entry
-                    log_entry = {
-                        'timestamp': timestamp.isoformat(),
-                        'type': detection_type,
-                        'confidence': confidence,
-                        'count': current_counts[detection_type]
-                    }
-                    
-                    malpractice_log.append(log_entry)
-                    
-                    # Save snapshot
-                    snapshot_filename = f"snapshot_{detection_type}_{timestamp.strftime('%Y%m%d_%H%M%S')}.jpg"
-                    snapshot_path = os.path.join('snapshots', snapshot_filename)
-                    cv2.imwrite(snapshot_path, processed_frame)
-                    
-                    log_entry['snapshot'] = snapshot_filename
-            
-            # Encode frame
-            ret, buffer = cv2.imencode('.jpg', processed_frame)
-            frame_bytes = buffer.tobytes()
-            
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-            
-            time.sleep(0.1)  # Control frame rate
-    
-    finally:
-        cap.release()
+    last_id = None
+    while monitoring_active and publisher.running:
+        published = publisher.wait(last_id, timeout=1.0)
+        if published is None:
+            continue
+        
+        last_id = published.frame_id
+        yield published.part
 
-@app.route('/get_alerts')
-def get_alerts():
-    """Get recent alerts for live updates"""
-    global malpractice_log, current_counts
+@app.route('/overlay_feed')
+def overlay_feed():
+    """Server-sent events stream of detection overlays keyed by frame id"""
+    return Response(generate_overlays(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+def generate_overlays():
+    """Yield each new overlay as a compact JSON event"""
+    publisher = frame_publisher
+    if not monitoring_active or not publisher:
+        return
     
+    last_id = None
+    while monitoring_active and publisher.running:
+        published = publisher.wait(last_id, timeout=1.0)
+        if published is None:
+            # Keep the connection alive while no frames are processed
+            yield ': keep-alive\n\n'
+            continue
+        
+        last_id = published.frame_id
+        yield published.overlay_event
+
+def get_alerts_payload():
+    """Recent alerts, counts and capture statistics for live updates"""
     # Return last 10 alerts and current counts
     recent_alerts = malpractice_log[-10:] if len(malpractice_log) > 10 else malpractice_log
     
-    return jsonify({
+    return {
         'alerts': recent_alerts,
         'counts': current_counts,
-        'total_events': len(malpractice_log)
-    })
+        'total_events': len(malpractice_log),
+        'capture': frame_grabber.get_stats() if frame_grabber else None
+    }
+
+@app.route('/get_alerts')
+def get_alerts():
+    """Get recent alerts for live updates"""
+    return jsonify(get_alerts_payload())
 
 @app.route('/summary')
 def summary():
@@ -215,6 +247,7 @@ def reset_session():
     global monitoring_active, malpractice_log, current_counts
     
     monitoring_active = False
+    stop_capture()
     malpractice_log = []
     current_counts = {
         'hand_gestures': 0,
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import logging
+import time
+from a2wsgi import WSGIMiddleware
+import app as monitor
+
+# Async serving mode: streaming routes run as coroutines on one event loop, so
+# idle or slow viewers cost a coroutine rather than an OS thread. Every other
+# route (pages, /get_alerts, /snapshot, /export_pdf, session changes) is handed
+# to the Flask app on a thread pool. State is in-process, so run a single worker:
+#   pip install -r requirements-asgi.txt
+#   uvicorn asgi:application --host 0.0.0.0 --port 5000
+
+logger = logging.getLogger(__name__)
+
+# Flask routes run concurrently on a pool of this many threads
+WSGI_WORKERS = 16
+
+flask_app = WSGIMiddleware(monitor.app, workers=WSGI_WORKERS)
+
+async def _wait_for_disconnect(receive):
+    """Return once the client goes away"""
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+async def _stream(receive, send, content_type, chunks):
+    """Send chunks from an async generator until it ends or the client disconnects"""
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [(b'content-type', content_type), (b'cache-control', b'no-cache')]
+    })
+
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        async for chunk in chunks:
+            if disconnected.done():
+                return
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+    except OSError:
+        # Client dropped mid-write
+        pass
+    finally:
+        disconnected.cancel()
+        await chunks.aclose()
+
+async def frame_chunks(publisher):
+    """Yield the shared publisher's encoded frames, skipping any this viewer was too slow for"""
+    last_id = None
+    while monitor.monitoring_active and publisher.running:
+        published = await publisher.wait_async(last_id, timeout=1.0)
+        if published is None:
+            continue
+
+        last_id = published.frame_id
+        yield published.part
+
+async def overlay_chunks(publisher):
+    """Yield each new overlay as a server-sent event"""
+    last_id = None
+    while monitor.monitoring_active and publisher.running:
+        published = await publisher.wait_async(last_id, timeout=1.0)
+        if published is None:
+            # Keep the connection alive while no frames are processed
+            yield b': keep-alive\n\n'
+            continue
+
+        last_id = published.frame_id
+        yield published.overlay_event
+
+async def alert_chunks(publisher, interval=2.0):
+    """Push alerts as soon as new events are logged, and at least every interval for capture stats"""
+    last_id = None
+    last_total = None
+    last_sent = 0.0
+    while monitor.monitoring_active and publisher.running:
+        published = await publisher.wait_async(last_id, timeout=interval)
+        if published is not None:
+            last_id = published.frame_id
+
+        total = len(monitor.malpractice_log)
+        if total == last_total and time.time() - last_sent < interval:
+            continue
+
+        last_total = total
+        last_sent = time.time()
+        yield f"data: {json.dumps(monitor.get_alerts_payload())}\n\n".encode()
+
+STREAM_ROUTES = {
+    '/video_feed': (b'multipart/x-mixed-replace; boundary=frame', frame_chunks),
+    '/overlay_feed': (b'text/event-stream', overlay_chunks),
+    '/alerts_feed': (b'text/event-stream', alert_chunks)
+}
+
+async def _lifespan(receive, send):
+    """Minimal lifespan handling (the Flask wrapper only accepts HTTP scopes)"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            monitor.stop_capture()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def application(scope, receive, send):
+    """ASGI entry point"""
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+
+    route = STREAM_ROUTES.get(scope['path']) if scope['type'] == 'http' else None
+    if route and scope['method'] == 'GET':
+        publisher = monitor.frame_publisher
+        if not monitor.monitoring_active or not publisher:
+            await send({'type': 'http.response.start', 'status': 204, 'headers': []})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        content_type, chunks = route
+        await _stream(receive, send, content_type, chunks(publisher))
+        return
+
+    await flask_app(scope, receive, send)
@@ -0,0 +1,215 @@
+import cv2
+import logging
+import threading
+import time
+
+NETWORK_SCHEMES = ('rtsp://', 'rtsps://', 'http://', 'https://', 'udp://', 'tcp://')
+
+class FrameGrabber:
+    def __init__(self, source, width=640, height=480, max_backoff=10.0):
+        """Initialize a background grabber for a camera index, video file or stream URL"""
+        self.logger = logging.getLogger(__name__)
+
+        self.source = source
+        self.width = width
+        self.height = height
+        self.is_network = isinstance(source, str) and source.lower().startswith(NETWORK_SCHEMES)
+        self.is_file = isinstance(source, str) and not self.is_network
+
+        # Reconnect backoff (seconds); only reset once a frame is actually read
+        self.initial_backoff = 0.5
+        self.max_backoff = max_backoff
+        self._backoff = self.initial_backoff
+
+        # Latest frame slot; older frames are overwritten, never queued
+        self._condition = threading.Condition()
+        self._frame = None
+        self._frame_id = 0
+        self._frame_time = 0.0
+        self._consumed_id = 0
+
+        # Capture statistics
+        self.frames_grabbed = 0
+        self.frames_dropped = 0
+        self.reconnects = 0
+        self.connected = False
+        # Queue latency: time the newest frame waited in our slot before being read
+        self._latency_total = 0.0
+        self._latency_samples = 0
+        self._last_latency = 0.0
+
+        # Stream lag (network sources): how far the frame's presentation timestamp
+        # trails the wall clock, relative to the freshest frame seen since connecting.
+        # Growth here is staleness piling up in the FFmpeg/network buffers.
+        self._min_clock_offset = None
+        self._stream_lag = None
+
+        self._cap = None
+        self._running = False
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background grabber thread"""
+        if self._running:
+            return self
+        self._running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='FrameGrabber', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the grabber thread and release the capture device"""
+        self._running = False
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        if not (self._thread and self._thread.is_alive()):
+            self._release()
+
+    def read(self, timeout=1.0):
+        """Return (frame_id, frame) for the newest frame not yet consumed, or (None, None) on timeout"""
+        deadline = time.time() + timeout
+        with self._condition:
+            while self._running and self._frame_id == self._consumed_id:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None, None
+                self._condition.wait(remaining)
+
+            if self._frame_id == self._consumed_id:
+                return None, None
+
+            # Frames grabbed since the last read were never processed
+            self.frames_dropped += max(0, self._frame_id - self._consumed_id - 1)
+            self._consumed_id = self._frame_id
+
+            self._last_latency = time.time() - self._frame_time
+            self._latency_total += self._last_latency
+            self._latency_samples += 1
+
+            return self._frame_id, self._frame
+
+    def get_stats(self):
+        """Get capture statistics for live reporting"""
+        avg_latency = self._latency_total / self._latency_samples if self._latency_samples else 0.0
+        return {
+            'connected': self.connected,
+            'frames_grabbed': self.frames_grabbed,
+            'frames_dropped': self.frames_dropped,
+            'reconnects': self.reconnects,
+            'queue_latency_ms': round(self._last_latency * 1000, 1),
+            'avg_queue_latency_ms': round(avg_latency * 1000, 1),
+            'stream_lag_ms': round(self._stream_lag * 1000, 1) if self._stream_lag is not None else None
+        }
+
+    def _open(self):
+        """Open the capture with low-latency and hardware decode settings when available"""
+        params = []
+        if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION') and hasattr(cv2, 'VIDEO_ACCELERATION_ANY'):
+            params = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+
+        if self.is_network:
+            cap = cv2.VideoCapture(self.source, cv2.CAP_FFMPEG, params)
+        elif self.is_file and params:
+            cap = cv2.VideoCapture(self.source, cv2.CAP_ANY, params)
+        else:
+            cap = cv2.VideoCapture(self.source)
+
+        if not cap.isOpened():
+            cap.release()
+            return None
+
+        # Honoured by some backends (e.g. V4L2); FFMPEG ignores it, which is why
+        # frames are drained continuously in the grabber thread
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not self.is_file:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+
+        return cap
+
+    def _release(self):
+        """Release the underlying capture if open"""
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+        self.connected = False
+        self._min_clock_offset = None
+
+    def _update_stream_lag(self):
+        """Compare the frame's stream timestamp with the wall clock"""
+        position = self._cap.get(cv2.CAP_PROP_POS_MSEC)
+        if not position or position <= 0:
+            return
+
+        offset = time.time() - position / 1000.0
+        if self._min_clock_offset is None or offset < self._min_clock_offset:
+            self._min_clock_offset = offset
+        self._stream_lag = offset - self._min_clock_offset
+
+    def _wait_backoff(self, reason):
+        """Sleep for the current backoff, then double it up to max_backoff"""
+        self.logger.warning(f"{reason} {self.source!r}, retrying in {self._backoff:.1f}s")
+        self._stop_event.wait(self._backoff)
+        self._backoff = min(self._backoff * 2, self.max_backoff)
+
+    def _connect(self):
+        """Open the source, retrying with exponential backoff until it succeeds or we stop"""
+        while self._running:
+            self._cap = self._open()
+            if self._cap is not None:
+                self.connected = True
+                return True
+
+            self._wait_backoff("Could not open video source")
+        return False
+
+    def _run(self):
+        """Grabber loop: keep only the newest frame and reconnect on failure"""
+        frame_interval = 0.0
+
+        while self._running:
+            if self._cap is None:
+                if not self._connect():
+                    break
+                if self.is_file:
+                    # Pace file playback at its native rate so it behaves like a live camera
+                    fps = self._cap.get(cv2.CAP_PROP_FPS)
+                    frame_interval = 1.0 / fps if fps and fps > 0 else 1.0 / 30
+
+            started = time.time()
+            success, frame = self._cap.read()
+
+            if not success:
+                if self.is_file:
+                    # Loop the video; wait a frame so a file that never decodes can't spin
+                    self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    self._stop_event.wait(frame_interval)
+                    continue
+
+                # Opened but not delivering frames: back off before reconnecting
+                self._release()
+                self.reconnects += 1
+                self._wait_backoff("Lost video source")
+                continue
+
+            self._backoff = self.initial_backoff
+
+            if self.is_network:
+                self._update_stream_lag()
+
+            with self._condition:
+                self._frame = frame
+                self._frame_id += 1
+                self._frame_time = time.time()
+                self.frames_grabbed += 1
+                self._condition.notify_all()
+
+            if frame_interval:
+                self._stop_event.wait(max(0.0, frame_interval - (time.time() - started)))
+
+        self._release()
@@ -12,7 +12,6 @@ class MalpracticeDetector:
         # Initialize MediaPipe
         self.mp_hands = mp.solutions.hands
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.mp_drawing = mp.solutions.drawing_utils
         
         # Initialize MediaPipe models
         self.hands = self.mp_hands.Hands(
@@ -41,18 +40,29 @@ class MalpracticeDetector:
         # Detection cooldown to prevent spam
         self.last_detection_time = {}
         self.detection_cooldown = 2.0  # seconds
+        
+        # Normalized hand landmarks from the last processed frame (for client overlays)
+        self.last_hand_landmarks = []
+        
+        # Overlay colors (BGR) used when annotating snapshots
+        self.overlay_colors = {
+            'hand_gestures': (0, 0, 255),
+            'mobile_phone': (255, 0, 0),
+            'talking': (0, 255, 255)
+        }
     
     def detect_hand_gestures(self, frame):
         """Detect suspicious hand gestures"""
         detections = []
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         results = self.hands.process(rgb_frame)
+        self.last_hand_landmarks = []
         
         if results.multi_hand_landmarks:
             for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                # Draw hand landmarks
-                self.mp_drawing.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+                # Keep hand landmarks for the client-side overlay
+                self.last_hand_landmarks.append(
+                    [[round(landmark.x, 3), round(landmark.y, 3)] for landmark in hand_landmarks.landmark])
                 
                 # Analyze hand gesture for suspicious behavior
                 if self._is_suspicious_hand_gesture(hand_landmarks):
@@ -71,15 +81,11 @@ class MalpracticeDetector:
                     x_max = min(w, x_max + padding)
                     y_max = min(h, y_max + padding)
                     
-                    # Draw bounding box
-                    cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (0, 0, 255), 2)
-                    cv2.putText(frame, 'SUSPICIOUS GESTURE', (x_min, y_min - 10), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-                    
                     detections.append({
                         'type': 'hand_gestures',
                         'confidence': 0.85,
-                        'bbox': (x_min, y_min, x_max, y_max)
+                        'bbox': (x_min, y_min, x_max, y_max),
+                        'label': 'SUSPICIOUS GESTURE'
                     })
         
         return detections
@@ -111,15 +117,11 @@ class MalpracticeDetector:
                         # Simulate detection confidence
                         confidence = 0.75
                         
-                        # Draw bounding box
-                        cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
-                        cv2.putText(frame, f'MOBILE PHONE ({confidence:.2f})', 
-                                  (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
-                        
                         detections.append({
                             'type': 'mobile_phone',
                             'confidence': confidence,
-                            'bbox': (x, y, x + w, y + h)
+                            'bbox': (x, y, x + w, y + h),
+                            'label': f'MOBILE PHONE ({confidence:.2f})'
                         })
                         
                         # Limit to one detection per frame to avoid spam
@@ -146,7 +148,7 @@ class MalpracticeDetector:
                     movement = self._calculate_mouth_movement(mouth_landmarks, self.prev_mouth_landmarks)
                     
                     if movement > self.mouth_movement_threshold:
-                        # Draw face mesh (mouth area)
+                        # Get mouth area in pixel coordinates
                         h, w, _ = frame.shape
                         mouth_points = [(int(landmark.x * w), int(landmark.y * h)) 
                                       for landmark in mouth_landmarks]
@@ -165,15 +167,11 @@ class MalpracticeDetector:
                             x_max = min(w, x_max + padding)
                             y_max = min(h, y_max + padding)
                             
-                            # Draw bounding box
-                            cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (0, 255, 255), 2)
-                            cv2.putText(frame, 'TALKING DETECTED', (x_min, y_min - 10), 
-                                      cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-                            
                             detections.append({
                                 'type': 'talking',
                                 'confidence': min(movement * 10, 1.0),  # Normalize movement to confidence
-                                'bbox': (x_min, y_min, x_max, y_max)
+                                'bbox': (x_min, y_min, x_max, y_max),
+                                'label': 'TALKING DETECTED'
                             })
                 
                 self.prev_mouth_landmarks = mouth_landmarks
@@ -236,30 +234,55 @@ class MalpracticeDetector:
         return False
     
     def process_frame(self, frame):
-        """Process a single frame and return annotated frame with detections"""
+        """Process a single frame and return detections plus overlay metadata for the client"""
         detections = []
         
-        # Make a copy of the frame for processing
-        processed_frame = frame.copy()
-        
-        # Detect hand gestures
-        hand_detections = self.detect_hand_gestures(processed_frame)
+        # Detectors only read the frame; overlays are drawn by the browser
+        hand_detections = self.detect_hand_gestures(frame)
         if hand_detections and self._should_detect('hand_gestures'):
             detections.extend(hand_detections)
         
         # Detect mobile phones
-        mobile_detections = self.detect_mobile_phone(processed_frame)
+        mobile_detections = self.detect_mobile_phone(frame)
         if mobile_detections and self._should_detect('mobile_phone'):
             detections.extend(mobile_detections)
         
         # Detect talking
-        talking_detections = self.detect_talking(processed_frame)
+        talking_detections = self.detect_talking(frame)
         if talking_detections and self._should_detect('talking'):
             detections.extend(talking_detections)
         
-        # Add timestamp overlay
-        timestamp = cv2.getTickCount()
-        cv2.putText(processed_frame, f'Frame: {timestamp}', (10, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        # Compact overlay: every box seen this frame (not only logged ones) and hand landmarks
+        h, w = frame.shape[:2]
+        overlay = {
+            'width': w,
+            'height': h,
+            'boxes': [
+                {'type': d['type'], 'bbox': [int(v) for v in d['bbox']], 'label': d['label']}
+                for d in hand_detections + mobile_detections + talking_detections
+            ],
+            'hands': self.last_hand_landmarks
+        }
+        
+        return detections, overlay
+    
+    def draw_overlays(self, frame, overlay):
+        """Return a copy of the frame with overlay boxes and hand landmarks burned in (used for snapshots)"""
+        annotated = frame.copy()
+        h, w = annotated.shape[:2]
+        
+        for hand in overlay['hands']:
+            points = [(int(x * w), int(y * h)) for x, y in hand]
+            for start, end in self.mp_hands.HAND_CONNECTIONS:
+                cv2.line(annotated, points[start], points[end], (255, 255, 255), 2)
+            for point in points:
+                cv2.circle(annotated, point, 3, (0, 0, 255), -1)
+        
+        for box in overlay['boxes']:
+            x_min, y_min, x_max, y_max = box['bbox']
+            color = self.overlay_colors.get(box['type'], (255, 255, 255))
+            cv2.rectangle(annotated, (x_min, y_min), (x_max, y_max), color, 2)
+            cv2.putText(annotated, box['label'], (x_min, y_min - 10), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
         
-        return processed_frame, detections
+        return annotated
@@ -0,0 +1,204 @@
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+# Load test for the MJPEG /video_feed stream.
+#
+# Opens many concurrent viewers against one or more servers and reports how
+# many were served, their frame rate and per-client latency (time from the
+# server's X-Timestamp to arrival; assumes client and server share a clock).
+# Run both servers side by side and start a monitoring session on each
+# (POST /start_monitoring), then compare them in one run:
+#
+#   python main.py --port 5000            # threaded Flask server
+#   python main.py --asgi --port 5001     # async server
+#   python loadtest.py --url http://127.0.0.1:5000/video_feed \
+#                      --url http://127.0.0.1:5001/video_feed --clients 500 --slow 100 --idle 1000
+#
+# Each server opens the video source itself, so use a file or stream URL that
+# both can read at once (a local camera can usually be opened by only one).
+
+class ClientStats:
+    def __init__(self):
+        """Per-viewer measurements"""
+        self.connected = False
+        self.error = None
+        self.timed_out = False
+        self.first_frame = None
+        self.elapsed = 0.0
+        self.frames = 0
+        self.latencies = []
+
+async def read_headers(reader):
+    """Read header lines up to the blank line and return them as a dict"""
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError('connection closed')
+        line = line.strip()
+        if not line:
+            return headers
+        if b':' in line:
+            name, value = line.split(b':', 1)
+            headers[name.strip().lower().decode()] = value.strip().decode()
+
+async def until(deadline, awaitable):
+    """Await with a timeout of whatever is left before the deadline"""
+    return await asyncio.wait_for(awaitable, max(0.0, deadline - time.time()))
+
+async def open_stream(url):
+    """Open an HTTP/1.0 GET (close-delimited, no chunked encoding) and skip the response headers"""
+    parts = urlsplit(url)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    writer.write(f'GET {parts.path or "/"} HTTP/1.0\r\nHost: {parts.netloc}\r\n\r\n'.encode())
+    await writer.drain()
+
+    status = await reader.readline()
+    if b' 200 ' not in status:
+        writer.close()
+        raise ConnectionError(status.decode().strip() or 'no response')
+    await read_headers(reader)
+    return reader, writer
+
+async def viewer(url, stats, deadline, read_delay=0.0):
+    """Read multipart frames until the deadline, recording latency per frame"""
+    started = time.time()
+    try:
+        reader, writer = await until(deadline, open_stream(url))
+    except asyncio.TimeoutError:
+        stats.timed_out = True
+        stats.elapsed = time.time() - started
+        return
+    except (OSError, ConnectionError) as e:
+        stats.error = str(e)
+        return
+
+    stats.connected = True
+    try:
+        while time.time() < deadline:
+            boundary = await until(deadline, reader.readline())
+            if not boundary:
+                break
+            if not boundary.strip():
+                continue
+
+            headers = await until(deadline, read_headers(reader))
+            await until(deadline, reader.readexactly(int(headers['content-length'])))
+            now = time.time()
+
+            if stats.first_frame is None:
+                stats.first_frame = now - started
+            stats.frames += 1
+            if 'x-timestamp' in headers:
+                stats.latencies.append(now - float(headers['x-timestamp']))
+
+            if read_delay:
+                # Slow consumer
+                await asyncio.sleep(read_delay)
+    except asyncio.TimeoutError:
+        # Still waiting on a frame at the deadline; only a failure if none ever arrived
+        stats.timed_out = stats.frames == 0
+    except (OSError, ConnectionError, asyncio.IncompleteReadError, KeyError, ValueError) as e:
+        stats.error = str(e) or type(e).__name__
+    finally:
+        stats.elapsed = time.time() - started
+        writer.close()
+
+async def idle_viewer(url, deadline, stats):
+    """Connect and never read, holding the connection open"""
+    try:
+        reader, writer = await until(deadline, open_stream(url))
+    except asyncio.TimeoutError:
+        stats.timed_out = True
+        return
+    except (OSError, ConnectionError) as e:
+        stats.error = str(e)
+        return
+
+    stats.connected = True
+    await asyncio.sleep(max(0.0, deadline - time.time()))
+    writer.close()
+
+def percentile(values, pct):
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+async def run(url, clients, slow, slow_delay, idle, duration, ramp):
+    """Run one load test against a URL and return summary numbers"""
+    deadline = time.time() + ramp + duration
+    active = [ClientStats() for _ in range(clients)]
+    slow_stats = [ClientStats() for _ in range(slow)]
+    idle_stats = [ClientStats() for _ in range(idle)]
+
+    coroutines = ([viewer(url, stats, deadline) for stats in active]
+                  + [viewer(url, stats, deadline, slow_delay) for stats in slow_stats]
+                  + [idle_viewer(url, deadline, stats) for stats in idle_stats])
+
+    tasks = []
+    for coroutine in coroutines:
+        tasks.append(asyncio.ensure_future(coroutine))
+        if ramp:
+            await asyncio.sleep(ramp / len(coroutines))
+
+    await asyncio.gather(*tasks)
+
+    served = [s for s in active if s.frames]
+    latencies = [lat for s in active for lat in s.latencies]
+    return {
+        'url': url,
+        'active_served': f'{len(served)}/{clients}',
+        'slow_connected': f'{sum(s.connected for s in slow_stats)}/{slow}',
+        'idle_connected': f'{sum(s.connected for s in idle_stats)}/{idle}',
+        'fps_per_client': statistics.mean(s.frames / s.elapsed for s in served) if served else 0.0,
+        'first_frame_ms': statistics.median(s.first_frame for s in served) * 1000 if served else 0.0,
+        'latency_p50_ms': percentile(latencies, 50) * 1000,
+        'latency_p95_ms': percentile(latencies, 95) * 1000,
+        'latency_max_ms': max(latencies) * 1000 if latencies else 0.0,
+        'timed_out': sum(1 for s in active + slow_stats + idle_stats if s.timed_out),
+        'errors': sum(1 for s in active + slow_stats + idle_stats if s.error)
+    }
+
+def raise_file_limit():
+    """Allow as many open sockets as the hard limit permits"""
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent viewer load test for /video_feed')
+    parser.add_argument('--url', action='append', required=True,
+                        help='video feed URL; repeat to compare servers')
+    parser.add_argument('--clients', type=int, default=100, help='viewers reading at full speed')
+    parser.add_argument('--slow', type=int, default=0, help='viewers that pause between frames')
+    parser.add_argument('--slow-delay', type=float, default=0.5, help='pause per frame for slow viewers (s)')
+    parser.add_argument('--idle', type=int, default=0, help='viewers that connect but never read')
+    parser.add_argument('--duration', type=float, default=15.0, help='measurement time after ramp-up (s)')
+    parser.add_argument('--ramp', type=float, default=2.0, help='time to spread connections over (s)')
+    args = parser.parse_args()
+
+    raise_file_limit()
+
+    results = []
+    for url in args.url:
+        print(f'Testing {url} ...')
+        results.append(asyncio.run(run(url, args.clients, args.slow, args.slow_delay,
+                                       args.idle, args.duration, args.ramp)))
+
+    print()
+    for result in results:
+        print(result['url'])
+        for key, value in result.items():
+            if key != 'url':
+                print(f'  {key:<16} {value:.1f}' if isinstance(value, float) else f'  {key:<16} {value}')
+
+if __name__ == '__main__':
+    main()
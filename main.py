@@ -1,4 +1,17 @@
+import argparse
 from app import app
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
+    parser = argparse.ArgumentParser(description='Student malpractice detection server')
+    parser.add_argument('--asgi', action='store_true', help='serve video and alert streams asynchronously')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
+
+    if args.asgi:
+        # Async serving: video and alert streams run as coroutines (pip install -r requirements-asgi.txt).
+        # Monitoring state lives in this process, so keep a single worker.
+        import uvicorn
+        import asgi
+        uvicorn.run(asgi.application, host='0.0.0.0', port=args.port)
+    else:
+        app.run(debug=True, host='0.0.0.0', port=args.port, threaded=True)
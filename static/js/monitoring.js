@@ -4,6 +4,7 @@ class MonitoringSystem {
         this.sessionStartTime = new Date();
         this.alertsContainer = document.getElementById('alertsContainer');
         this.updateInterval = null;
+        this.alertsSource = null;
         this.maxAlerts = 50; // Maximum number of alerts to show
         
         this.init();
@@ -18,8 +19,8 @@ class MonitoringSystem {
         this.updateSessionDuration();
         setInterval(() => this.updateSessionDuration(), 1000);
         
-        // Start polling for alerts
-        this.startAlertsPolling();
+        // Stream alerts when the server supports it, otherwise poll
+        this.startAlertsStream();
         
         // Set session start time
         document.getElementById('sessionStart').textContent = 
@@ -43,6 +44,26 @@ class MonitoringSystem {
         document.getElementById('sessionDuration').textContent = durationStr;
     }
     
+    startAlertsStream() {
+        if (!window.EventSource) {
+            this.startAlertsPolling();
+            return;
+        }
+        
+        // Pushed by the async server; the threaded server has no /alerts_feed
+        this.alertsSource = new EventSource('/alerts_feed');
+        this.alertsSource.onmessage = (event) => {
+            this.applyAlerts(JSON.parse(event.data));
+        };
+        this.alertsSource.onerror = () => {
+            this.alertsSource.close();
+            this.alertsSource = null;
+            if (!this.updateInterval) {
+                this.startAlertsPolling();
+            }
+        };
+    }
+    
     startAlertsPolling() {
         // Initial load
         this.fetchAlerts();
@@ -57,16 +78,20 @@ class MonitoringSystem {
         try {
             const response = await fetch('/get_alerts');
             if (response.ok) {
-                const data = await response.json();
-                this.updateStatistics(data.counts, data.total_events);
-                this.updateAlerts(data.alerts);
-                this.updateDetectionRate(data.total_events);
+                this.applyAlerts(await response.json());
             }
         } catch (error) {
             console.error('Error fetching alerts:', error);
         }
     }
     
+    applyAlerts(data) {
+        this.updateStatistics(data.counts, data.total_events);
+        this.updateAlerts(data.alerts);
+        this.updateDetectionRate(data.total_events);
+        this.updateCaptureStats(data.capture);
+    }
+    
     updateStatistics(counts, totalEvents) {
         document.getElementById('handGestureCount').textContent = counts.hand_gestures || 0;
         document.getElementById('mobilePhoneCount').textContent = counts.mobile_phone || 0;
@@ -132,6 +157,20 @@ class MonitoringSystem {
         document.getElementById('detectionRate').textContent = `${rate}/min`;
     }
     
+    updateCaptureStats(capture) {
+        if (!capture) {
+            return;
+        }
+        
+        const latency = capture.connected ? `${capture.queue_latency_ms} ms` : 'Reconnecting...';
+        document.getElementById('queueLatency').textContent = latency;
+        
+        // Stream lag is only measured for network (RTSP/HTTP) sources
+        const lag = capture.stream_lag_ms !== null ? `${capture.stream_lag_ms} ms` : 'N/A';
+        document.getElementById('streamLag').textContent = lag;
+        document.getElementById('droppedFrames').textContent = capture.frames_dropped;
+    }
+    
     formatDetectionType(type) {
         const typeMap = {
             'hand_gestures': 'Suspicious Hand Gesture',
@@ -142,6 +181,10 @@ class MonitoringSystem {
     }
     
     stopPolling() {
+        if (this.alertsSource) {
+            this.alertsSource.close();
+            this.alertsSource = null;
+        }
         if (this.updateInterval) {
             clearInterval(this.updateInterval);
             this.updateInterval = null;
@@ -149,6 +192,219 @@ class MonitoringSystem {
     }
 }
 
+// MediaPipe hand landmark connections (21-point hand model)
+const HAND_CONNECTIONS = [
+    [0, 1], [1, 2], [2, 3], [3, 4],
+    [0, 5], [5, 6], [6, 7], [7, 8],
+    [5, 9], [9, 10], [10, 11], [11, 12],
+    [9, 13], [13, 14], [14, 15], [15, 16],
+    [13, 17], [0, 17], [17, 18], [18, 19], [19, 20]
+];
+
+const OVERLAY_COLORS = {
+    'hand_gestures': '#ff0000',
+    'mobile_phone': '#0000ff',
+    'talking': '#ffff00'
+};
+
+// Draws raw MJPEG frames on a canvas and overlays detections matched by frame id
+class VideoOverlayRenderer {
+    constructor(canvas) {
+        this.canvas = canvas;
+        this.ctx = canvas.getContext('2d');
+        this.videoSrc = canvas.dataset.videoSrc;
+        this.overlaySrc = canvas.dataset.overlaySrc;
+        this.overlays = new Map();
+        this.maxOverlays = 60; // Overlays kept while waiting for their frame
+        this.maxOverlayGap = 2; // Frames an overlay may be reused for before it counts as stale
+        this.showOverlays = true;
+        this.eventSource = null;
+        this.abortController = null;
+        
+        this.init();
+    }
+    
+    init() {
+        const toggle = document.getElementById('showOverlays');
+        if (toggle) {
+            this.showOverlays = toggle.checked;
+            toggle.addEventListener('change', () => {
+                this.showOverlays = toggle.checked;
+            });
+        }
+        
+        this.startOverlayStream();
+        this.startVideoStream();
+    }
+    
+    startOverlayStream() {
+        this.eventSource = new EventSource(this.overlaySrc);
+        this.eventSource.onmessage = (event) => {
+            const overlay = JSON.parse(event.data);
+            this.overlays.set(overlay.frame_id, overlay);
+            
+            // Drop the oldest overlays
+            while (this.overlays.size > this.maxOverlays) {
+                this.overlays.delete(this.overlays.keys().next().value);
+            }
+        };
+    }
+    
+    async startVideoStream() {
+        this.abortController = new AbortController();
+        
+        try {
+            const response = await fetch(this.videoSrc, { signal: this.abortController.signal });
+            const reader = response.body.getReader();
+            let buffer = new Uint8Array(0);
+            
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+                
+                buffer = this.concatBytes(buffer, value);
+                buffer = await this.drainParts(buffer);
+            }
+        } catch (error) {
+            if (error.name !== 'AbortError') {
+                console.error('Error reading video stream:', error);
+            }
+        }
+    }
+    
+    concatBytes(a, b) {
+        const merged = new Uint8Array(a.length + b.length);
+        merged.set(a, 0);
+        merged.set(b, a.length);
+        return merged;
+    }
+    
+    indexOfHeaderEnd(bytes) {
+        for (let i = 0; i + 3 < bytes.length; i++) {
+            if (bytes[i] === 13 && bytes[i + 1] === 10 && bytes[i + 2] === 13 && bytes[i + 3] === 10) {
+                return i;
+            }
+        }
+        return -1;
+    }
+    
+    async drainParts(buffer) {
+        // Each part: "--frame\r\n" + headers + "\r\n\r\n" + JPEG (Content-Length bytes) + "\r\n"
+        while (true) {
+            const headerEnd = this.indexOfHeaderEnd(buffer);
+            if (headerEnd < 0) {
+                return buffer;
+            }
+            
+            const headers = new TextDecoder().decode(buffer.subarray(0, headerEnd));
+            const lengthMatch = headers.match(/Content-Length:\s*(\d+)/i);
+            const frameIdMatch = headers.match(/X-Frame-Id:\s*(\d+)/i);
+            if (!lengthMatch) {
+                return buffer;
+            }
+            
+            const start = headerEnd + 4;
+            const end = start + parseInt(lengthMatch[1], 10);
+            if (buffer.length < end + 2) {
+                return buffer;
+            }
+            
+            const jpeg = buffer.slice(start, end);
+            const frameId = frameIdMatch ? parseInt(frameIdMatch[1], 10) : null;
+            await this.drawFrame(jpeg, frameId);
+            
+            buffer = buffer.slice(end + 2);
+        }
+    }
+    
+    async drawFrame(jpeg, frameId) {
+        const bitmap = await createImageBitmap(new Blob([jpeg], { type: 'image/jpeg' }));
+        
+        if (this.canvas.width !== bitmap.width || this.canvas.height !== bitmap.height) {
+            this.canvas.width = bitmap.width;
+            this.canvas.height = bitmap.height;
+        }
+        this.ctx.drawImage(bitmap, 0, 0);
+        bitmap.close();
+        
+        if (this.showOverlays && frameId !== null) {
+            const overlay = this.findOverlay(frameId);
+            if (overlay) {
+                this.drawOverlay(overlay);
+            }
+        }
+    }
+    
+    findOverlay(frameId) {
+        // Exact match, or the newest overlay at most maxOverlayGap frames older;
+        // anything staler (e.g. overlay stream dropped) draws nothing
+        if (this.overlays.has(frameId)) {
+            return this.overlays.get(frameId);
+        }
+        
+        let best = null;
+        this.overlays.forEach((overlay, id) => {
+            if (id <= frameId && frameId - id <= this.maxOverlayGap && (!best || id > best.frame_id)) {
+                best = overlay;
+            }
+        });
+        return best;
+    }
+    
+    drawOverlay(overlay) {
+        const ctx = this.ctx;
+        const scaleX = this.canvas.width / overlay.width;
+        const scaleY = this.canvas.height / overlay.height;
+        
+        // Hand landmarks (normalized coordinates)
+        overlay.hands.forEach(hand => {
+            const points = hand.map(([x, y]) => [x * this.canvas.width, y * this.canvas.height]);
+            
+            ctx.strokeStyle = '#ffffff';
+            ctx.lineWidth = 2;
+            HAND_CONNECTIONS.forEach(([a, b]) => {
+                ctx.beginPath();
+                ctx.moveTo(points[a][0], points[a][1]);
+                ctx.lineTo(points[b][0], points[b][1]);
+                ctx.stroke();
+            });
+            
+            ctx.fillStyle = '#ff0000';
+            points.forEach(([x, y]) => {
+                ctx.beginPath();
+                ctx.arc(x, y, 3, 0, 2 * Math.PI);
+                ctx.fill();
+            });
+        });
+        
+        // Detection boxes (pixel coordinates of the source frame)
+        ctx.font = 'bold 16px sans-serif';
+        overlay.boxes.forEach(box => {
+            const [xMin, yMin, xMax, yMax] = box.bbox;
+            const color = OVERLAY_COLORS[box.type] || '#ffffff';
+            
+            ctx.strokeStyle = color;
+            ctx.fillStyle = color;
+            ctx.lineWidth = 2;
+            ctx.strokeRect(xMin * scaleX, yMin * scaleY, (xMax - xMin) * scaleX, (yMax - yMin) * scaleY);
+            ctx.fillText(box.label, xMin * scaleX, yMin * scaleY - 10);
+        });
+    }
+    
+    stop() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+        if (this.abortController) {
+            this.abortController.abort();
+            this.abortController = null;
+        }
+    }
+}
+
 // Global functions
 function stopMonitoring() {
     // Show confirmation modal
@@ -183,6 +439,12 @@ document.addEventListener('DOMContentLoaded', function() {
     // Initialize monitoring system
     window.monitoringSystem = new MonitoringSystem();
     
+    // Start raw video with client-side detection overlays
+    const videoCanvas = document.getElementById('videoCanvas');
+    if (videoCanvas) {
+        window.videoRenderer = new VideoOverlayRenderer(videoCanvas);
+    }
+    
     // Add click effects to buttons
     document.querySelectorAll('.btn').forEach(btn => {
         btn.addEventListener('click', function(e) {
@@ -232,6 +494,9 @@ window.addEventListener('beforeunload', function() {
     if (window.monitoringSystem) {
         window.monitoringSystem.stopPolling();
     }
+    if (window.videoRenderer) {
+        window.videoRenderer.stop();
+    }
 });
 
 // Keyboard shortcuts
@@ -0,0 +1,163 @@
+import asyncio
+import cv2
+import json
+import logging
+import threading
+import time
+
+class PublishedFrame:
+    def __init__(self, frame_id, part, overlay, timestamp):
+        """Encoded frame shared by every viewer"""
+        self.frame_id = frame_id
+        self.part = part
+        self.overlay = overlay
+        self.timestamp = timestamp
+
+        # Serialized once and reused by every overlay stream listener
+        self.overlay_event = (f"id: {frame_id}\n"
+                              f"data: {json.dumps(overlay, separators=(',', ':'))}\n\n").encode()
+
+class FramePublisher:
+    def __init__(self, grabber, detector, on_detections=None, max_fps=10):
+        """Run detection once per captured frame and share the encoded result with all viewers"""
+        self.logger = logging.getLogger(__name__)
+
+        self.grabber = grabber
+        self.detector = detector
+        self.on_detections = on_detections
+        self.frame_interval = 1.0 / max_fps if max_fps else 0.0
+
+        self.latest = None
+
+        # Threaded (WSGI) viewers wait on a condition; async viewers on one event per loop
+        self._condition = threading.Condition()
+        self._loop_events = {}
+        self._loop_lock = threading.Lock()
+
+        self._running = False
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        """Start the publisher thread"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='FramePublisher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop publishing and wake all waiting viewers"""
+        self._running = False
+        self._notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+
+    def wait(self, last_id=None, timeout=1.0):
+        """Block until a frame newer than last_id is published; return it, or None on timeout"""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._running or (self.latest is not None and self.latest.frame_id != last_id),
+                timeout=timeout)
+            latest = self.latest
+
+        if latest is None or latest.frame_id == last_id:
+            return None
+        return latest
+
+    async def wait_async(self, last_id=None, timeout=1.0):
+        """Await a frame newer than last_id without holding a thread; return it, or None on timeout"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while self._running and (self.latest is None or self.latest.frame_id == last_id):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+
+            with self._loop_lock:
+                event = self._loop_events.get(loop)
+                if event is None:
+                    event = self._loop_events[loop] = asyncio.Event()
+
+            # A frame published before the event was registered would not wake us
+            if self.latest is not None and self.latest.frame_id != last_id:
+                break
+
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+
+        latest = self.latest
+        if latest is None or latest.frame_id == last_id:
+            return None
+        return latest
+
+    def _notify(self):
+        """Wake threaded and async viewers after a new frame"""
+        with self._condition:
+            self._condition.notify_all()
+
+        with self._loop_lock:
+            loops = list(self._loop_events)
+        for loop in loops:
+            if loop.is_closed():
+                with self._loop_lock:
+                    self._loop_events.pop(loop, None)
+                continue
+            loop.call_soon_threadsafe(self._wake_loop, loop)
+
+    def _wake_loop(self, loop):
+        """Release every coroutine waiting on this loop (runs inside the loop)"""
+        with self._loop_lock:
+            event = self._loop_events.pop(loop, None)
+        if event is not None:
+            event.set()
+
+    def _run(self):
+        """Publisher loop: detect, encode once, notify viewers"""
+        while self._running:
+            started = time.time()
+
+            frame_id, frame = self.grabber.read(timeout=1.0)
+            if frame is None:
+                # No new frame yet (stream stalled or reconnecting)
+                continue
+
+            try:
+                detections, overlay = self.detector.process_frame(frame)
+
+                # Don't log into a session that was stopped while this frame was processed
+                if detections and self.on_detections and self._running:
+                    self.on_detections(frame, detections, overlay)
+
+                # Encode the raw frame once; overlays are drawn client-side
+                ret, buffer = cv2.imencode('.jpg', frame)
+                if not ret:
+                    continue
+                frame_bytes = buffer.tobytes()
+            except Exception as e:
+                self.logger.error(f"Error processing frame {frame_id}: {e}")
+                continue
+
+            timestamp = time.time()
+            part = (b'--frame\r\n'
+                    b'Content-Type: image/jpeg\r\n'
+                    + (f'Content-Length: {len(frame_bytes)}\r\n'
+                       f'X-Frame-Id: {frame_id}\r\n'
+                       f'X-Timestamp: {timestamp:.3f}\r\n\r\n').encode()
+                    + frame_bytes + b'\r\n')
+
+            self.latest = PublishedFrame(frame_id, part, dict(overlay, frame_id=frame_id), timestamp)
+            self._notify()
+
+            # Control frame rate
+            if self.frame_interval:
+                time.sleep(max(0.0, self.frame_interval - (time.time() - started)))
+
+        self._notify()
@@ -0,0 +1,112 @@
+import time
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from capture import FrameGrabber
+
+FRAME_COUNT = 30
+
+@pytest.fixture
+def stand_in_stream(tmp_path):
+    """Write a short file-backed stand-in stream whose frame brightness encodes the frame index"""
+    path = str(tmp_path / 'stream.avi')
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, (160, 120))
+    for i in range(FRAME_COUNT):
+        writer.write(np.full((120, 160, 3), i * 8, dtype=np.uint8))
+    writer.release()
+    return path
+
+def frame_index(frame):
+    """Recover the written frame index from its brightness"""
+    return int(round(frame.mean() / 8))
+
+class FailingCapture:
+    """Capture that opens but never delivers a frame"""
+    def read(self):
+        return False, None
+
+    def get(self, prop):
+        return 0
+
+    def release(self):
+        pass
+
+def test_read_returns_newest_frame(stand_in_stream):
+    grabber = FrameGrabber(stand_in_stream).start()
+    try:
+        time.sleep(0.3)
+        frame_id, frame = grabber.read(timeout=1.0)
+
+        assert frame_id is not None
+        assert frame_id <= grabber.frames_grabbed
+        assert frame_index(frame) == (frame_id - 1) % FRAME_COUNT
+        # Everything grabbed before the newest frame was skipped
+        assert grabber.frames_dropped == frame_id - 1
+
+        time.sleep(0.2)
+        second_id, frame = grabber.read(timeout=1.0)
+
+        assert second_id > frame_id + 1
+        assert frame_index(frame) == (second_id - 1) % FRAME_COUNT
+        assert grabber.frames_dropped == second_id - 2
+    finally:
+        grabber.stop()
+
+def test_read_times_out_without_new_frame(stand_in_stream):
+    grabber = FrameGrabber(stand_in_stream).start()
+    try:
+        frame_id, _ = grabber.read(timeout=1.0)
+        assert frame_id is not None
+
+        # Nothing newer than the consumed frame can arrive within 1 ms at 30 fps
+        assert grabber.read(timeout=0.001) == (None, None)
+    finally:
+        grabber.stop()
+
+def test_stop_ends_thread(stand_in_stream):
+    grabber = FrameGrabber(stand_in_stream).start()
+    grabber.read(timeout=1.0)
+    grabber.stop()
+
+    assert not grabber._thread.is_alive()
+    assert not grabber.connected
+    assert grabber.read(timeout=0.1) == (None, None)
+
+def test_unopenable_source_backs_off(tmp_path):
+    grabber = FrameGrabber(str(tmp_path / 'missing.avi'), max_backoff=0.2)
+    grabber.initial_backoff = grabber._backoff = 0.05
+
+    attempts = []
+    open_source = grabber._open
+
+    def record_open():
+        attempts.append(time.time())
+        return open_source()
+
+    grabber._open = record_open
+    grabber.start()
+    time.sleep(0.7)
+    grabber.stop()
+
+    gaps = [b - a for a, b in zip(attempts, attempts[1:])]
+    assert len(attempts) >= 3
+    assert gaps[0] >= 0.04
+    assert gaps[1] >= 0.09
+    assert all(gap <= 0.3 for gap in gaps)
+    assert not grabber.connected
+    assert grabber.frames_grabbed == 0
+
+def test_source_without_frames_reconnects_with_backoff():
+    grabber = FrameGrabber('rtsp://camera.invalid/stream', max_backoff=0.2)
+    grabber.initial_backoff = grabber._backoff = 0.05
+    grabber._open = FailingCapture
+
+    grabber.start()
+    time.sleep(0.7)
+    grabber.stop()
+
+    # 0.05 + 0.1 + 0.2 + 0.2 + ... : a handful of retries, not a tight loop
+    assert 2 <= grabber.reconnects <= 6
+    assert grabber._backoff == 0.2
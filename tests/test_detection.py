@@ -0,0 +1,108 @@
+import sys
+import types
+from types import SimpleNamespace
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+try:
+    import mediapipe  # noqa: F401
+except ImportError:
+    # detection imports mediapipe at module level; the tests swap in a stub below
+    sys.modules['mediapipe'] = types.ModuleType('mediapipe')
+
+import detection
+from detection import MalpracticeDetector
+
+HAND_CONNECTIONS = frozenset([(0, 1), (1, 2), (2, 3), (3, 4), (0, 5), (5, 6), (6, 7), (7, 8)])
+
+def make_hand():
+    """21 landmarks with thumb and index tips touching (a 'writing' gesture)"""
+    points = [SimpleNamespace(x=0.5, y=0.5 + i * 0.01) for i in range(21)]
+    points[4] = SimpleNamespace(x=0.40, y=0.40)
+    points[8] = SimpleNamespace(x=0.41, y=0.41)
+    return SimpleNamespace(landmark=points)
+
+class StubModel:
+    def __init__(self, results):
+        self.results = results
+
+    def process(self, frame):
+        return self.results
+
+@pytest.fixture
+def make_detector(monkeypatch):
+    """Build a MalpracticeDetector whose MediaPipe models return scripted results"""
+    def build(hands=()):
+        hand_results = SimpleNamespace(multi_hand_landmarks=list(hands) or None)
+        face_results = SimpleNamespace(multi_face_landmarks=None)
+        stub_mp = SimpleNamespace(solutions=SimpleNamespace(
+            hands=SimpleNamespace(
+                Hands=lambda **kwargs: StubModel(hand_results),
+                HandLandmark=SimpleNamespace(THUMB_TIP=4, INDEX_FINGER_TIP=8, MIDDLE_FINGER_TIP=12,
+                                             RING_FINGER_TIP=16, PINKY_TIP=20, WRIST=0),
+                HAND_CONNECTIONS=HAND_CONNECTIONS),
+            face_mesh=SimpleNamespace(FaceMesh=lambda **kwargs: StubModel(face_results))))
+        monkeypatch.setattr(detection, 'mp', stub_mp)
+        return MalpracticeDetector()
+    return build
+
+def test_process_frame_returns_overlay_without_touching_frame(make_detector):
+    detector = make_detector(hands=[make_hand()])
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+
+    detections, overlay = detector.process_frame(frame)
+
+    # Overlays are metadata only; the frame is encoded raw
+    assert not frame.any()
+
+    assert [d['type'] for d in detections] == ['hand_gestures']
+    assert set(overlay) == {'width', 'height', 'boxes', 'hands'}
+    assert (overlay['width'], overlay['height']) == (320, 240)
+
+    box, = overlay['boxes']
+    assert box['type'] == 'hand_gestures'
+    assert box['label'] == 'SUSPICIOUS GESTURE'
+    assert len(box['bbox']) == 4 and all(isinstance(v, int) for v in box['bbox'])
+
+    hand, = overlay['hands']
+    assert len(hand) == 21
+    assert hand[4] == [0.4, 0.4]
+
+def test_overlay_keeps_boxes_during_cooldown(make_detector):
+    detector = make_detector(hands=[make_hand()])
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+
+    detector.process_frame(frame)
+    detections, overlay = detector.process_frame(frame)
+
+    # Not logged again within the cooldown, but still drawn for viewers
+    assert detections == []
+    assert len(overlay['boxes']) == 1
+
+def test_process_frame_empty_overlay(make_detector):
+    detector = make_detector()
+    detections, overlay = detector.process_frame(np.zeros((120, 160, 3), dtype=np.uint8))
+
+    assert detections == []
+    assert overlay == {'width': 160, 'height': 120, 'boxes': [], 'hands': []}
+
+def test_draw_overlays_annotates_copy(make_detector):
+    detector = make_detector()
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    overlay = {
+        'width': 160,
+        'height': 120,
+        'boxes': [{'type': 'mobile_phone', 'bbox': [20, 30, 60, 90], 'label': 'MOBILE PHONE (0.75)'}],
+        'hands': [[[0.8, 0.5 + i * 0.02] for i in range(21)]]
+    }
+
+    annotated = detector.draw_overlays(frame, overlay)
+
+    assert not frame.any()
+    assert annotated.shape == frame.shape
+    # Box edge in the mobile phone color (BGR blue)
+    assert tuple(annotated[60, 20]) == detector.overlay_colors['mobile_phone']
+    # Hand landmark point drawn in red
+    assert tuple(annotated[int(0.5 * 120), int(0.8 * 160)]) == (0, 0, 255)
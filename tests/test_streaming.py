@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from streaming import FramePublisher
+
+class StubGrabber:
+    """Grabber that hands out frames only when a test pushes them"""
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending = []
+        self._frame_id = 0
+
+    def push(self):
+        with self._condition:
+            self._frame_id += 1
+            self._pending.append((self._frame_id, np.zeros((24, 32, 3), dtype=np.uint8)))
+            self._condition.notify_all()
+
+    def read(self, timeout=1.0):
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending, timeout=timeout)
+            if not self._pending:
+                return None, None
+            return self._pending.pop(0)
+
+class StubDetector:
+    """Detector reporting one detection per frame; can be held mid-frame"""
+    def __init__(self, hold=False):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        if not hold:
+            self.release.set()
+
+    def process_frame(self, frame):
+        self.entered.set()
+        self.release.wait(5.0)
+        h, w = frame.shape[:2]
+        detections = [{'type': 'talking', 'confidence': 0.9, 'bbox': (1, 2, 3, 4), 'label': 'TALKING DETECTED'}]
+        return detections, {'width': w, 'height': h, 'boxes': [], 'hands': []}
+
+@pytest.fixture
+def publisher():
+    grabber = StubGrabber()
+    publisher = FramePublisher(grabber, StubDetector(), max_fps=0).start()
+    publisher.grabber_stub = grabber
+    yield publisher
+    publisher.stop()
+
+def test_wait_returns_only_newer_frame(publisher):
+    publisher.grabber_stub.push()
+    first = publisher.wait(None, timeout=2.0)
+    assert first.frame_id == 1
+    assert b'X-Frame-Id: 1' in first.part
+    assert first.overlay['frame_id'] == 1
+
+    # Nothing newer than frame 1 yet
+    assert publisher.wait(1, timeout=0.1) is None
+
+    publisher.grabber_stub.push()
+    second = publisher.wait(1, timeout=2.0)
+    assert second.frame_id == 2
+
+def test_wait_async_returns_only_newer_frame(publisher):
+    async def scenario():
+        publisher.grabber_stub.push()
+        first = await publisher.wait_async(None, timeout=2.0)
+
+        timed_out = await publisher.wait_async(first.frame_id, timeout=0.1)
+
+        # Waiter registered before the frame is published must be woken by it
+        waiter = asyncio.ensure_future(publisher.wait_async(first.frame_id, timeout=2.0))
+        await asyncio.sleep(0.05)
+        publisher.grabber_stub.push()
+        second = await waiter
+        return first, timed_out, second
+
+    first, timed_out, second = asyncio.run(scenario())
+    assert first.frame_id == 1
+    assert timed_out is None
+    assert second.frame_id == 2
+
+def test_stop_releases_blocked_waiters(publisher):
+    publisher.grabber_stub.push()
+    assert publisher.wait(None, timeout=2.0).frame_id == 1
+
+    results = {}
+
+    def blocked_wait():
+        results['sync'] = publisher.wait(1, timeout=5.0)
+
+    async def blocked_wait_async():
+        return await publisher.wait_async(1, timeout=5.0)
+
+    async def scenario():
+        waiter = asyncio.ensure_future(blocked_wait_async())
+        await asyncio.sleep(0.05)
+        await asyncio.get_running_loop().run_in_executor(None, publisher.stop)
+        return await asyncio.wait_for(waiter, 1.0)
+
+    thread = threading.Thread(target=blocked_wait)
+    thread.start()
+    time.sleep(0.05)
+
+    started = time.time()
+    results['async'] = asyncio.run(scenario())
+    thread.join(1.0)
+
+    assert not thread.is_alive()
+    assert time.time() - started < 1.5
+    assert results == {'sync': None, 'async': None}
+    assert not publisher.running
+
+def test_no_detections_logged_after_stop():
+    grabber = StubGrabber()
+    detector = StubDetector(hold=True)
+    logged = []
+    publisher = FramePublisher(grabber, detector, on_detections=lambda *args: logged.append(args),
+                               max_fps=0).start()
+
+    # Stop while the publisher is in the middle of processing a frame
+    grabber.push()
+    assert detector.entered.wait(2.0)
+    stopper = threading.Thread(target=publisher.stop)
+    stopper.start()
+    while publisher.running:
+        time.sleep(0.01)
+    detector.release.set()
+    stopper.join(3.0)
+
+    assert logged == []
+    assert publisher.latest is None or publisher.latest.frame_id == 1
+
+def test_detections_logged_while_running(publisher):
+    logged = []
+    publisher.on_detections = lambda frame, detections, overlay: logged.append(detections)
+
+    publisher.grabber_stub.push()
+    assert publisher.wait(None, timeout=2.0) is not None
+    assert len(logged) == 1
+    assert logged[0][0]['type'] == 'talking'